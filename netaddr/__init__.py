@@ -19,12 +19,14 @@ from netaddr.core import (AddrConversionError, AddrFormatError,
     NotRegisteredError, ZEROFILL, Z, INET_PTON, P, NOHOST, N)
 
 from netaddr.ip import (IPAddress, IPNetwork, IPRange, all_matching_cidrs,
-    cidr_abbrev_to_verbose, cidr_exclude, cidr_merge, iprange_to_cidrs,
-    iter_iprange, iter_unique_ips, largest_matching_cidr,
-    smallest_matching_cidr, spanning_cidr)
+    all_matching_cidrs_batch, cidr_abbrev_to_verbose, cidr_exclude,
+    cidr_merge, iprange_to_cidrs, iter_iprange, iter_unique_ips,
+    largest_matching_cidr, smallest_matching_cidr, spanning_cidr)
 
 from netaddr.ip.sets import IPSet
 
+from netaddr.ip.trie import IPTrie
+
 from netaddr.ip.glob import (IPGlob, cidr_to_glob, glob_to_cidrs,
     glob_to_iprange, glob_to_iptuple, iprange_to_globs, valid_glob)
 
@@ -6,6 +6,8 @@
 """Routines for IPv4 and IPv6 addresses, subnets and ranges."""
 
 import sys as _sys
+import bisect as _bisect
+from operator import itemgetter as _itemgetter
 
 from netaddr.core import AddrFormatError, AddrConversionError, num_bits, \
     DictDotLookup, NOHOST, N, INET_PTON, P, ZEROFILL, Z
@@ -15,6 +17,9 @@ from netaddr.strategy import ipv4 as _ipv4, ipv6 as _ipv6
 from netaddr.compat import _sys_maxint, _iter_next, _iter_range, _is_str, _int_type, \
     _str_type
 
+#: A dictionary mapping IP versions to their strategy modules.
+_VERSION_TO_MODULE = {4: _ipv4, 6: _ipv6}
+
 
 class BaseIP(object):
     """
@@ -66,10 +71,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             equivalent to ``other``, ``False`` otherwise.
         """
-        try:
-            return self.key() == other.key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.key() == other.key()
 
     def __ne__(self, other):
         """
@@ -78,10 +82,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             not equivalent to ``other``, ``False`` otherwise.
         """
-        try:
-            return self.key() != other.key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.key() != other.key()
 
     def __lt__(self, other):
         """
@@ -90,10 +93,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             less than ``other``, ``False`` otherwise.
         """
-        try:
-            return self.sort_key() < other.sort_key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.sort_key() < other.sort_key()
 
     def __le__(self, other):
         """
@@ -102,10 +104,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             less than or equal to ``other``, ``False`` otherwise.
         """
-        try:
-            return self.sort_key() <= other.sort_key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.sort_key() <= other.sort_key()
 
     def __gt__(self, other):
         """
@@ -114,10 +115,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             greater than ``other``, ``False`` otherwise.
         """
-        try:
-            return self.sort_key() > other.sort_key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.sort_key() > other.sort_key()
 
     def __ge__(self, other):
         """
@@ -126,10 +126,9 @@ class BaseIP(object):
         :return: ``True`` if this `IPAddress` or `IPNetwork` object is
             greater than or equal to ``other``, ``False`` otherwise.
         """
-        try:
-            return self.sort_key() >= other.sort_key()
-        except (AttributeError, TypeError):
+        if not isinstance(other, BaseIP):
             return NotImplemented
+        return self.sort_key() >= other.sort_key()
 
     def is_unicast(self):
         """:return: ``True`` if this IP is unicast, ``False`` otherwise"""
@@ -137,10 +136,7 @@ class BaseIP(object):
 
     def is_multicast(self):
         """:return: ``True`` if this IP is multicast, ``False`` otherwise"""
-        if self._module == _ipv4:
-            return self in IPV4_MULTICAST
-        elif self._module == _ipv6:
-            return self in IPV6_MULTICAST
+        return _in_bounds(_MULTICAST[self._module], self)
 
     def is_loopback(self):
         """
@@ -148,10 +144,7 @@ class BaseIP(object):
             transmission), ``False`` otherwise.
             References: RFC 3330 and 4291.
         """
-        if self._module.version == 4:
-            return self in IPV4_LOOPBACK
-        elif self._module.version == 6:
-            return self in IPV6_LOOPBACK
+        return _in_bounds(_LOOPBACK[self._module], self)
 
     def is_private(self):
         """
@@ -159,14 +152,8 @@ class BaseIP(object):
             (i.e. non-public), ``False`` otherwise. Reference: RFCs 1918,
             3330, 4193, 3879 and 2365.
         """
-        if self._module.version == 4:
-            for cidr in IPV4_PRIVATE:
-                if self in cidr:
-                    return True
-        elif self._module.version == 6:
-            for cidr in IPV6_PRIVATE:
-                if self in cidr:
-                    return True
+        if _in_ranges(_PRIVATE_RANGES[self._module], self):
+            return True
 
         if self.is_link_local():
             return True
@@ -178,39 +165,28 @@ class BaseIP(object):
         :return: ``True`` if this IP is link-local address ``False`` otherwise.
             Reference: RFCs 3927 and 4291.
         """
-        if self._module.version == 4:
-            return self in IPV4_LINK_LOCAL
-        elif self._module.version == 6:
-            return self in IPV6_LINK_LOCAL
+        return _in_bounds(_LINK_LOCAL[self._module], self)
 
     def is_reserved(self):
         """
         :return: ``True`` if this IP is in IANA reserved range, ``False``
             otherwise. Reference: RFCs 3330 and 3171.
         """
-        if self._module.version == 4:
-            for cidr in IPV4_RESERVED:
-                if self in cidr:
-                    return True
-        elif self._module.version == 6:
-            for cidr in IPV6_RESERVED:
-                if self in cidr:
-                    return True
-        return False
+        return _in_ranges(_RESERVED_RANGES[self._module], self)
 
     def is_ipv4_mapped(self):
         """
-        :return: ``True`` if this IP is IPv4-compatible IPv6 address, ``False``
+        :return: ``True`` if this IP is IPv4-mapped IPv6 address, ``False``
             otherwise.
         """
-        return self._module.version == 6 and (self._value >> 32) == 0xffff
+        return self._module is _ipv6 and (self._value >> 32) == 0xffff
 
     def is_ipv4_compat(self):
         """
-        :return: ``True`` if this IP is IPv4-mapped IPv6 address, ``False``
+        :return: ``True`` if this IP is IPv4-compatible IPv6 address, ``False``
             otherwise.
         """
-        return self._module.version == 6 and (self._value >> 32) == 0
+        return self._module is _ipv6 and (self._value >> 32) == 0
 
     @property
     def info(self):
@@ -255,6 +231,16 @@ class IPAddress(BaseIP):
             details.
 
         """
+        if type(addr) is int and version in (4, 6):
+            #   Fast path for integer values of an explicit IP version, the
+            #   form used by most internal constructions.
+            module = _VERSION_TO_MODULE[version]
+            if not 0 <= addr <= module.max_int:
+                raise AddrFormatError('bad address format: %r' % (addr,))
+            self._value = addr
+            self._module = module
+            return
+
         super(IPAddress, self).__init__()
 
         if isinstance(addr, BaseIP):
@@ -267,14 +253,13 @@ class IPAddress(BaseIP):
         else:
             #   Explicit IP address version.
             if version is not None:
-                if version == 4:
-                    self._module = _ipv4
-                elif version == 6:
-                    self._module = _ipv6
-                else:
+                self._module = _VERSION_TO_MODULE.get(version)
+                if self._module is None:
                     raise ValueError('%r is an invalid IP version!' % version)
 
-            if _is_str(addr) and '/' in addr:
+            is_str = _is_str(addr)
+
+            if is_str and '/' in addr:
                 raise ValueError('%s() does not support netmasks or subnet' \
                     ' prefixes! See documentation for details.'
                     % self.__class__.__name__)
@@ -282,17 +267,19 @@ class IPAddress(BaseIP):
             if self._module is None:
                 #   IP version is implicit, detect it from addr.
                 if isinstance(addr, _int_type):
-                    try:
-                        if 0 <= int(addr) <= _ipv4.max_int:
-                            self._value = int(addr)
-                            self._module = _ipv4
-                        elif _ipv4.max_int < int(addr) <= _ipv6.max_int:
-                            self._value = int(addr)
-                            self._module = _ipv6
-                    except ValueError:
-                        pass
+                    int_val = int(addr)
+                    if 0 <= int_val <= _ipv4.max_int:
+                        self._value = int_val
+                        self._module = _ipv4
+                    elif _ipv4.max_int < int_val <= _ipv6.max_int:
+                        self._value = int_val
+                        self._module = _ipv6
                 else:
-                    for module in _ipv4, _ipv6:
+                    modules = (_ipv4, _ipv6)
+                    if isinstance(addr, _str_type):
+                        #   Only IPv6 addresses contain colons.
+                        modules = (_ipv6,) if ':' in addr else (_ipv4,)
+                    for module in modules:
                         try:
                             self._value = module.str_to_int(addr, flags)
                         except:
@@ -306,18 +293,30 @@ class IPAddress(BaseIP):
                         'address from %r' % addr)
             else:
                 #   IP version is explicit.
-                if _is_str(addr):
+                if is_str:
                     try:
                         self._value = self._module.str_to_int(addr, flags)
                     except AddrFormatError:
                         raise AddrFormatError('base address %r is not IPv%d'
                             % (addr, self._module.version))
                 else:
-                    if 0 <= int(addr) <= self._module.max_int:
-                        self._value = int(addr)
+                    int_val = int(addr)
+                    if 0 <= int_val <= self._module.max_int:
+                        self._value = int_val
                     else:
                         raise AddrFormatError('bad address format: %r' % (addr,))
 
+    @classmethod
+    def _from_int(cls, value, module):
+        """
+        Internal constructor for an integer value that is already known to
+        be valid for module, bypassing the checks done by `__init__`.
+        """
+        ip = cls.__new__(cls)
+        ip._value = value
+        ip._module = module
+        return ip
+
     def __getstate__(self):
         """:returns: Pickled state of an `IPAddress` object."""
         return self._value, self._module.version
@@ -330,12 +329,9 @@ class IPAddress(BaseIP):
         value, version = state
 
         self._value = value
+        self._module = _VERSION_TO_MODULE.get(version)
 
-        if version == 4:
-            self._module = _ipv4
-        elif version == 6:
-            self._module = _ipv6
-        else:
+        if self._module is None:
             raise ValueError('unpickling failed for object state: %s' \
                 % str(state))
 
@@ -353,36 +349,27 @@ class IPAddress(BaseIP):
         if self._value == 0:
             return 0
 
+        #   The host bits of a netmask are its trailing zeros, which is one
+        #   less than the bit length of the lowest set bit.
         i_val = self._value
-        numbits = 0
-
-        while i_val > 0:
-            if i_val & 1 == 1:
-                break
-            numbits += 1
-            i_val >>= 1
-
-        mask_length = self._module.width - numbits
-
-        if not 0 <= mask_length <= self._module.width:
-            raise ValueError('Unexpected mask length %d for address type!' \
-                % mask_length)
-
-        return mask_length
+        return self._module.width - num_bits(i_val & -i_val) + 1
 
     def is_hostmask(self):
         """
         :return: ``True`` if this IP address host mask, ``False`` otherwise.
         """
-        int_val = self._value + 1
-        return (int_val & (int_val - 1) == 0)
+        #   A hostmask is a run of low-order one bits, so adding one to it
+        #   must carry through every set bit.
+        int_val = self._value
+        return int_val & (int_val + 1) == 0
 
     def is_netmask(self):
         """
         :return: ``True`` if this IP address network mask, ``False`` otherwise.
         """
-        int_val = (self._value ^ self._module.max_int) + 1
-        return (int_val & (int_val - 1) == 0)
+        #   A netmask is the bitwise inverse of a hostmask.
+        int_val = self._value ^ self._module.max_int
+        return int_val & (int_val + 1) == 0
 
     def __iadd__(self, num):
         """
@@ -585,9 +572,10 @@ class IPAddress(BaseIP):
             else:
                 ip = klass(self._value, 6)
         elif self._module.version == 4:
-            #   IPv4-Compatible IPv6 address
-            ip = klass(self._value, 6)
-            if not ipv4_compatible:
+            if ipv4_compatible:
+                #   IPv4-Compatible IPv6 address
+                ip = klass(self._value, 6)
+            else:
                 #   IPv4-Mapped IPv6 address
                 ip = klass(0xffff00000000 + self._value, 6)
 
@@ -614,7 +602,9 @@ class IPAddress(BaseIP):
         :return: bitwise OR (x | y) between the integer value of this IP
             address and ``other``.
         """
-        return self.__class__(self._value | int(other), self._module.version)
+        if type(other) is not int:
+            other = int(other)
+        return self.__class__(self._value | other, self._module.version)
 
     def __and__(self, other):
         """
@@ -623,7 +613,9 @@ class IPAddress(BaseIP):
         :return: bitwise AND (x & y) between the integer value of this IP
             address and ``other``.
         """
-        return self.__class__(self._value & int(other), self._module.version)
+        if type(other) is not int:
+            other = int(other)
+        return self.__class__(self._value & other, self._module.version)
 
     def __xor__(self, other):
         """
@@ -632,7 +624,9 @@ class IPAddress(BaseIP):
         :return: bitwise exclusive OR (x ^ y) between the integer value of
             this IP address and ``other``.
         """
-        return self.__class__(self._value ^ int(other), self._module.version)
+        if type(other) is not int:
+            other = int(other)
+        return self.__class__(self._value ^ other, self._module.version)
 
     def __lshift__(self, numbits):
         """
@@ -681,22 +675,21 @@ class IPListMixin(object):
         :return: An iterator providing access to all `IPAddress` objects
             within range represented by this ranged IP object.
         """
-        start_ip = IPAddress(self.first, self._module.version)
-        end_ip = IPAddress(self.last, self._module.version)
-        return iter_iprange(start_ip, end_ip)
+        return _iter_iprange(self.first, self.last, 1, self._module)
 
     @property
     def size(self):
         """
         The total number of IP addresses within this ranged IP object.
         """
-        return int(self.last - self.first + 1)
+        return self.last - self.first + 1
 
     def __len__(self):
         """
         :return: the number of IP addresses in this ranged IP object. Raises
-            an `IndexError` if size > system max int (a Python 2.x
-            limitation). Use the .size property for subnets of any size.
+            an `IndexError` if size > system max int (a limitation of
+            len() in both Python 2.x and 3.x). Use the .size property for
+            subnets of any size.
         """
         size = self.size
         if size > _sys_maxint:
@@ -710,35 +703,35 @@ class IPListMixin(object):
             index or slice. As slicing can produce large sequences of objects
             an iterator is returned instead of the more usual `list`.
         """
-        item = None
+        module = self._module
+        first = self.first
+        size = self.size
 
         if hasattr(index, 'indices'):
-            if self._module.version == 6:
+            if module.version == 6:
                 raise TypeError('IPv6 slices are not supported!')
 
-            (start, stop, step) = index.indices(self.size)
+            (start, stop, step) = index.indices(size)
 
             if (start + step < 0) or (step > stop):
                 #   step value exceeds start and stop boundaries.
-                item = iter([IPAddress(self.first, self._module.version)])
+                item = iter([IPAddress._from_int(first, module)])
             else:
-                start_ip = IPAddress(self.first + start, self._module.version)
-                end_ip = IPAddress(self.first + stop - step, self._module.version)
-                item = iter_iprange(start_ip, end_ip, step)
+                item = _iter_iprange(first + start, first + stop - step, step,
+                    module)
         else:
             try:
                 index = int(index)
-                if (- self.size) <= index < 0:
-                    #   negative index.
-                    item = IPAddress(self.last + index + 1, self._module.version)
-                elif 0 <= index <= (self.size - 1):
-                    #   Positive index or zero index.
-                    item = IPAddress(self.first + index, self._module.version)
-                else:
-                    raise IndexError('index out range for address range size!')
             except ValueError:
                 raise TypeError('unsupported index type %r!' % index)
 
+            if index < 0:
+                #   negative index.
+                index += size
+            if not 0 <= index < size:
+                raise IndexError('index out range for address range size!')
+            item = IPAddress._from_int(first + index, module)
+
         return item
 
     def __contains__(self, other):
@@ -789,22 +782,21 @@ def parse_ip_network(module, addr, implicit_prefix=False, flags=0):
             #TODO: deprecate this option in netaddr 0.8.x
             addr = cidr_abbrev_to_verbose(addr)
 
-        if '/' in addr:
-            val1, val2 = addr.split('/', 1)
-        else:
-            val1 = addr
+        val1, sep, val2 = addr.partition('/')
+        if not sep:
             val2 = None
 
+        #   The address parts are parsed by the strategy module directly,
+        #   skipping the argument checks done by `IPAddress`.
         try:
-            ip = IPAddress(val1, module.version, flags=INET_PTON)
+            value = module.str_to_int(val1, INET_PTON)
         except AddrFormatError:
             if module.version == 4:
                 #   Try a partial IPv4 network address...
                 expanded_addr = _ipv4.expand_partial_address(val1)
-                ip = IPAddress(expanded_addr, module.version, flags=INET_PTON)
+                value = module.str_to_int(expanded_addr, INET_PTON)
             else:
                 raise AddrFormatError('invalid IPNetwork address %s!' % addr)
-        value = ip._value
 
         try:
             #   Integer CIDR prefix.
@@ -815,7 +807,8 @@ def parse_ip_network(module, addr, implicit_prefix=False, flags=0):
                 prefixlen = module.width
         except ValueError:
             #   Not an integer prefix, try a netmask/hostmask prefix.
-            mask = IPAddress(val2, module.version, flags=INET_PTON)
+            mask = IPAddress._from_int(module.str_to_int(val2, INET_PTON),
+                module)
             if mask.is_netmask():
                 prefixlen = module.netmask_to_prefix[mask._value]
             elif mask.is_hostmask():
@@ -838,6 +831,43 @@ def parse_ip_network(module, addr, implicit_prefix=False, flags=0):
     return value, prefixlen
 
 
+def _parse_network(addr, implicit_prefix, version, flags):
+    """
+    Parses addr for `IPNetwork.__init__`, detecting the IP version if it is
+    not given.
+
+    :return: a tuple of the integer value, prefix length and strategy module.
+    """
+    if version is not None:
+        module = _VERSION_TO_MODULE.get(version)
+        if module is None:
+            raise ValueError('%r is an invalid IP version!' % version)
+        value, prefixlen = parse_ip_network(module, addr,
+            implicit_prefix=implicit_prefix, flags=flags)
+        return value, prefixlen, module
+
+    modules = (_ipv4, _ipv6)
+    if isinstance(addr, _str_type):
+        #   Only IPv6 addresses contain colons.
+        modules = (_ipv6,) if ':' in addr else (_ipv4,)
+    for module in modules:
+        try:
+            value, prefixlen = parse_ip_network(module, addr,
+                implicit_prefix, flags)
+        except AddrFormatError:
+            continue
+        return value, prefixlen, module
+
+    raise AddrFormatError('invalid IPNetwork %s' % (addr,))
+
+
+#: Results of `_parse_network` for strings, keyed on its arguments.
+_NETWORK_CACHE = {}
+
+#: The number of entries after which `_NETWORK_CACHE` is emptied.
+_NETWORK_CACHE_SIZE = 4096
+
+
 class IPNetwork(BaseIP, IPListMixin):
     """
     An IPv4 or IPv6 network or subnet.
@@ -916,46 +946,50 @@ class IPNetwork(BaseIP, IPListMixin):
 
         value, prefixlen, module = None, None, None
 
-        if hasattr(addr, '_prefixlen'):
+        if isinstance(addr, IPNetwork):
             #   IPNetwork object copy constructor
             value = addr._value
             module = addr._module
             prefixlen = addr._prefixlen
-        elif hasattr(addr, '_value'):
+        elif isinstance(addr, IPAddress):
             #   IPAddress object copy constructor
             value = addr._value
             module = addr._module
             prefixlen = module.width
-        elif version == 4:
-            value, prefixlen = parse_ip_network(_ipv4, addr,
-                implicit_prefix=implicit_prefix, flags=flags)
-            module = _ipv4
-        elif version == 6:
-            value, prefixlen = parse_ip_network(_ipv6, addr,
-                implicit_prefix=implicit_prefix, flags=flags)
-            module = _ipv6
+        elif isinstance(addr, _str_type):
+            #   Strings are parsed once and the result is reused, as the
+            #   same CIDRs tend to be constructed over and over again.
+            key = (addr, implicit_prefix, version, flags)
+            parsed = _NETWORK_CACHE.get(key)
+            if parsed is None:
+                parsed = _parse_network(addr, implicit_prefix, version, flags)
+                if len(_NETWORK_CACHE) >= _NETWORK_CACHE_SIZE:
+                    #   Emptying the dict is a single atomic operation, so
+                    #   concurrent constructors never see a missing key.
+                    _NETWORK_CACHE.clear()
+                _NETWORK_CACHE[key] = parsed
+            value, prefixlen, module = parsed
         else:
-            if version is not None:
-                raise ValueError('%r is an invalid IP version!' % version)
-            try:
-                module = _ipv4
-                value, prefixlen = parse_ip_network(module, addr,
-                    implicit_prefix, flags)
-            except AddrFormatError:
-                try:
-                    module = _ipv6
-                    value, prefixlen = parse_ip_network(module, addr,
-                        implicit_prefix, flags)
-                except AddrFormatError:
-                    pass
-
-                if value is None:
-                    raise AddrFormatError('invalid IPNetwork %s' % (addr,))
+            value, prefixlen, module = _parse_network(addr, implicit_prefix,
+                version, flags)
 
         self._value = value
         self._prefixlen = prefixlen
         self._module = module
 
+    @classmethod
+    def _from_int(cls, value, prefixlen, module):
+        """
+        Internal constructor for an integer value and prefix that are already
+        known to be valid for module, bypassing the parsing done by
+        `__init__`.
+        """
+        network = cls.__new__(cls)
+        network._value = value
+        network._prefixlen = prefixlen
+        network._module = module
+        return network
+
     def __getstate__(self):
         """:return: Pickled state of an `IPNetwork` object."""
         return self._value, self._prefixlen, self._module.version
@@ -968,12 +1002,9 @@ class IPNetwork(BaseIP, IPListMixin):
         value, prefixlen, version = state
 
         self._value = value
+        self._module = _VERSION_TO_MODULE.get(version)
 
-        if version == 4:
-            self._module = _ipv4
-        elif version == 6:
-            self._module = _ipv6
-        else:
+        if self._module is None:
             raise ValueError('unpickling failed for object state %s' \
                 % (state,))
 
@@ -1029,7 +1060,7 @@ class IPNetwork(BaseIP, IPListMixin):
         The integer value of first IP address found within this `IPNetwork`
         object.
         """
-        return self._value & (self._module.max_int ^ self._hostmask_int)
+        return self._value & self._netmask_int
 
     @property
     def last(self):
@@ -1037,14 +1068,19 @@ class IPNetwork(BaseIP, IPListMixin):
         The integer value of last IP address found within this `IPNetwork`
         object.
         """
-        hostmask = (1 << (self._module.width - self._prefixlen)) - 1
-        return self._value | hostmask
+        return self._value | self._hostmask_int
+
+    @property
+    def size(self):
+        """
+        The total number of IP addresses within this `IPNetwork` object.
+        """
+        return self._hostmask_int + 1
 
     @property
     def netmask(self):
         """The subnet mask of this `IPNetwork` object."""
-        netmask = self._module.max_int ^ self._hostmask_int
-        return IPAddress(netmask, self._module.version)
+        return IPAddress(self._netmask_int, self._module.version)
 
     @netmask.setter
     def netmask(self, value):
@@ -1054,26 +1090,26 @@ class IPNetwork(BaseIP, IPListMixin):
         if ip.version != self.version:
             raise ValueError("IP version mismatch: %s and %s" % (ip, self))
 
-        if not ip.is_netmask():
+        prefixlen = self._module.netmask_to_prefix.get(ip._value)
+        if prefixlen is None:
             raise ValueError("Invalid subnet mask specified: %s" % str(value))
 
-        self.prefixlen = ip.netmask_bits()
+        self.prefixlen = prefixlen
 
     @property
     def _netmask_int(self):
         """Same as self.netmask, but in integer format"""
-        return self._module.max_int ^ self._hostmask_int
+        return self._module.prefix_to_netmask[self._prefixlen]
 
     @property
     def hostmask(self):
         """The host mask of this `IPNetwork` object."""
-        hostmask = (1 << (self._module.width - self._prefixlen)) - 1
-        return IPAddress(hostmask, self._module.version)
+        return IPAddress(self._hostmask_int, self._module.version)
 
     @property
     def _hostmask_int(self):
         """Same as self.hostmask, but in integer format"""
-        return (1 << (self._module.width - self._prefixlen)) - 1
+        return self._module.prefix_to_hostmask[self._prefixlen]
 
     @property
     def cidr(self):
@@ -1081,9 +1117,11 @@ class IPNetwork(BaseIP, IPListMixin):
         The true CIDR address for this `IPNetwork` object which omits any
         host bits to the right of the CIDR subnet prefix.
         """
-        return IPNetwork(
-                (self._value & self._netmask_int, self._prefixlen),
-                version=self._module.version)
+        module = self._module
+        prefixlen = self._prefixlen
+        return IPNetwork._from_int(
+            self._value & module.prefix_to_netmask[prefixlen], prefixlen,
+            module)
 
     def __iadd__(self, num):
         """
@@ -1134,6 +1172,12 @@ class IPNetwork(BaseIP, IPListMixin):
         :return: ``True`` if other falls within the boundary of this one,
             ``False`` otherwise.
         """
+        if isinstance(other, IPAddress):
+            if self._module is not other._module:
+                return False
+            netmask = self._module.prefix_to_netmask[self._prefixlen]
+            return other._value & netmask == self._value & netmask
+
         if isinstance(other, BaseIP):
             if self._module.version != other._module.version:
                 return False
@@ -1149,8 +1193,6 @@ class IPNetwork(BaseIP, IPListMixin):
                         (((self_net + 1) << shiftwidth) > other._end._value))
 
             other_net = other._value >> shiftwidth
-            if isinstance(other, IPAddress):
-                return other_net == self_net
             if isinstance(other, IPNetwork):
                 return self_net == other_net and self._prefixlen <= other._prefixlen
 
@@ -1168,7 +1210,7 @@ class IPNetwork(BaseIP, IPListMixin):
         :return: A key tuple used to compare and sort this `IPNetwork` correctly.
         """
         net_size_bits = self._prefixlen - 1
-        first = self._value & (self._module.max_int ^ self._hostmask_int)
+        first = self._value & self._netmask_int
         host_bits = self._value - first
         return self._module.version, first, net_size_bits, host_bits
 
@@ -1182,14 +1224,13 @@ class IPNetwork(BaseIP, IPListMixin):
         klass = self.__class__
 
         if self._module.version == 4:
-            ip = klass('%s/%d' % (self.ip, self.prefixlen))
+            ip = klass((self._value, self._prefixlen), version=4)
         elif self._module.version == 6:
             if 0 <= self._value <= _ipv4.max_int:
-                addr = _ipv4.int_to_str(self._value)
-                ip = klass('%s/%d' % (addr, self.prefixlen - 96))
+                ip = klass((self._value, self._prefixlen - 96), version=4)
             elif _ipv4.max_int <= self._value <= 0xffffffffffff:
-                addr = _ipv4.int_to_str(self._value - 0xffff00000000)
-                ip = klass('%s/%d' % (addr, self.prefixlen - 96))
+                ip = klass((self._value - 0xffff00000000,
+                            self._prefixlen - 96), version=4)
             else:
                 raise AddrConversionError('IPv6 address %s unsuitable for ' \
                     'conversion to IPv4!' % self)
@@ -1234,8 +1275,7 @@ class IPNetwork(BaseIP, IPListMixin):
 
         :return: The adjacent subnet preceding this `IPNetwork` object.
         """
-        ip_copy = self.__class__('%s/%d' % (self.network, self.prefixlen),
-            self._module.version)
+        ip_copy = self._from_int(self.first, self._prefixlen, self._module)
         ip_copy -= step
         return ip_copy
 
@@ -1246,8 +1286,7 @@ class IPNetwork(BaseIP, IPListMixin):
 
         :return: The adjacent subnet succeeding this `IPNetwork` object.
         """
-        ip_copy = self.__class__('%s/%d' % (self.network, self.prefixlen),
-            self._module.version)
+        ip_copy = self._from_int(self.first, self._prefixlen, self._module)
         ip_copy += step
         return ip_copy
 
@@ -1264,15 +1303,15 @@ class IPNetwork(BaseIP, IPListMixin):
         if not 0 <= prefixlen <= self._module.width:
             raise ValueError('CIDR prefix /%d invalid for IPv%d!' \
                 % (prefixlen, self._module.version))
+        if prefixlen > self._prefixlen:
+            raise ValueError('CIDR prefix /%d is longer than /%d!' \
+                % (prefixlen, self._prefixlen))
 
-        supernets = []
-        # Use a copy of self as we'll be editing it.
-        supernet = self.cidr
-        supernet._prefixlen = prefixlen
-        while supernet._prefixlen != self._prefixlen:
-            supernets.append(supernet.cidr)
-            supernet._prefixlen += 1
-        return supernets
+        module = self._module
+        value = self._value
+        netmasks = module.prefix_to_netmask
+        return [IPNetwork._from_int(value & netmasks[p], p, module)
+            for p in _iter_range(prefixlen, self._prefixlen)]
 
     def subnet(self, prefixlen, count=None, fmt=None):
         """
@@ -1287,7 +1326,7 @@ class IPNetwork(BaseIP, IPListMixin):
 
         :return: an iterator containing IPNetwork subnet objects.
         """
-        if not 0 <= self.prefixlen <= self._module.width:
+        if not 0 <= prefixlen <= self._module.width:
             raise ValueError('CIDR prefix /%d invalid for IPv%d!' \
                 % (prefixlen, self._module.version))
 
@@ -1296,8 +1335,7 @@ class IPNetwork(BaseIP, IPListMixin):
             return
 
         #   Calculate number of subnets to be returned.
-        width = self._module.width
-        max_subnets = 2 ** (width - self.prefixlen) // 2 ** (width - prefixlen)
+        max_subnets = 1 << (prefixlen - self.prefixlen)
 
         if count is None:
             count = max_subnets
@@ -1305,15 +1343,15 @@ class IPNetwork(BaseIP, IPListMixin):
         if not 1 <= count <= max_subnets:
             raise ValueError('count outside of current IP subnet boundary!')
 
-        base_subnet = self._module.int_to_str(self.first)
-        i = 0
-        while(i < count):
-            subnet = self.__class__('%s/%d' % (base_subnet, prefixlen),
-                self._module.version)
-            subnet.value += (subnet.size * i)
-            subnet.prefixlen = prefixlen
-            i += 1
-            yield subnet
+        #   Everything but the subnet value is fixed for the whole loop.
+        from_int = self._from_int
+        module = self._module
+        step = 1 << (module.width - prefixlen)
+        value = self.first
+        stop = value + count * step
+        while value < stop:
+            yield from_int(value, prefixlen, module)
+            value += step
 
     def iter_hosts(self):
         """
@@ -1337,32 +1375,34 @@ class IPNetwork(BaseIP, IPListMixin):
         :return: an IPAddress iterator
         """
         it_hosts = iter([])
+        first, last = self.first, self.last
 
         if self._module.version == 4:
             #   IPv4 logic.
             if self.size >= 4:
-                it_hosts = iter_iprange(
-                        IPAddress(self.first + 1, self._module.version),
-                        IPAddress(self.last - 1, self._module.version))
+                first += 1
+                last -= 1
+            if last < _sys_maxint:
+                #   Let the builtin range do the counting where it can.
+                from_int = IPAddress._from_int
+                module = self._module
+                it_hosts = (from_int(i, module)
+                    for i in _iter_range(first, last + 1))
             else:
-                it_hosts = iter_iprange(
-                        IPAddress(self.first, self._module.version),
-                        IPAddress(self.last, self._module.version))
+                it_hosts = _iter_iprange(first, last, 1, self._module)
         else:
             #   IPv6 logic.
             # RFC 4291 section 2.6.1 says that the first IP in the network is
             # the Subnet-Router anycast address. This address cannot be
             # assigned to a host, so use self.first+1.
             if self.size >= 2:
-                it_hosts = iter_iprange(
-                    IPAddress(self.first + 1, self._module.version),
-                    IPAddress(self.last, self._module.version))
+                it_hosts = _iter_iprange(first + 1, last, 1, self._module)
         return it_hosts
 
     def __str__(self):
         """:return: this IPNetwork in CIDR format"""
         addr = self._module.int_to_str(self._value)
-        return "%s/%s" % (addr, self.prefixlen)
+        return "%s/%d" % (addr, self._prefixlen)
 
     def __repr__(self):
         """:return: Python statement to create an equivalent object"""
@@ -1417,12 +1457,14 @@ class IPRange(BaseIP, IPListMixin):
         self._end = IPAddress(end, version)
 
     def __contains__(self, other):
+        if isinstance(other, IPAddress):
+            if self._module is not other._module:
+                return False
+            return self._start._value <= other._value <= self._end._value
+
         if isinstance(other, BaseIP):
             if self._module.version != other._module.version:
                 return False
-            if isinstance(other, IPAddress):
-                return (self._start._value <= other._value and
-                        self._end._value >= other._value)
             if isinstance(other, IPRange):
                 return (self._start._value <= other._start._value and
                         self._end._value >= other._end._value)
@@ -1433,7 +1475,7 @@ class IPRange(BaseIP, IPListMixin):
                 other_next_start = other_start + (1 << shiftwidth)
 
                 return (self._start._value <= other_start and
-                        self._end._value > other_next_start)
+                        self._end._value >= other_next_start - 1)
 
         # Whatever it is, try to interpret it as IPAddress.
         return IPAddress(other) in self
@@ -1441,12 +1483,12 @@ class IPRange(BaseIP, IPListMixin):
     @property
     def first(self):
         """The integer value of first IP address in this `IPRange` object."""
-        return int(self._start)
+        return self._start._value
 
     @property
     def last(self):
         """The integer value of last IP address in this `IPRange` object."""
-        return int(self._end)
+        return self._end._value
 
     def key(self):
         """
@@ -1458,15 +1500,17 @@ class IPRange(BaseIP, IPListMixin):
         """
         :return: A key tuple used to compare and sort this `IPRange` correctly.
         """
-        skey = self._module.width - num_bits(self.size)
-        return self._module.version, self._start._value, skey
+        first = self._start._value
+        skey = self._module.width - num_bits(self._end._value - first + 1)
+        return self._module.version, first, skey
 
     def cidrs(self):
         """
         The list of CIDR addresses found within the lower and upper bound
         addresses of this `IPRange`.
         """
-        return iprange_to_cidrs(self._start, self._end)
+        return list(_iter_cidrs(self._start._value, self._end._value,
+            self._module))
 
     def __str__(self):
         """:return: this `IPRange` in a common representational format."""
@@ -1485,11 +1529,20 @@ def iter_unique_ips(*args):
     :return: A generator that flattens out IP subnets, yielding unique
         individual IP addresses (no duplicates).
     """
-    for cidr in cidr_merge(args):
-        for ip in cidr:
+    for version, first, last, _ in _iter_merged(args):
+        for ip in _iter_iprange(first, last, 1, _VERSION_TO_MODULE[version]):
             yield ip
 
 
+#: The old-style classful IPv4 prefix for each possible first octet.
+_CLASSFUL_PREFIX = (
+    (8,) * 128 +    #   0-127: legacy class 'A' classification.
+    (16,) * 64 +    #   128-191: legacy class 'B' classification.
+    (24,) * 32 +    #   192-223: legacy class 'C' classification.
+    (4,) * 16 +     #   224-239: multicast address range.
+    (32,) * 16)     #   240-255: default.
+
+
 def cidr_abbrev_to_verbose(abbrev_cidr):
     """
     A function that converts abbreviated IPv4 CIDRs to their more verbose
@@ -1520,15 +1573,7 @@ def cidr_abbrev_to_verbose(abbrev_cidr):
         octet = int(octet)
         if not 0 <= octet <= 255:
             raise IndexError('Invalid octet: %r!' % octet)
-        if 0 <= octet <= 127:       #   Legacy class 'A' classification.
-            return 8
-        elif 128 <= octet <= 191:   #   Legacy class 'B' classification.
-            return 16
-        elif 192 <= octet <= 223:   #   Legacy class 'C' classification.
-            return 24
-        elif 224 <= octet <= 239:   #   Multicast address range.
-            return 4
-        return 32                   #   Default.
+        return _CLASSFUL_PREFIX[octet]
 
     if _is_str(abbrev_cidr):
         if ':' in abbrev_cidr or abbrev_cidr == '':
@@ -1540,9 +1585,8 @@ def cidr_abbrev_to_verbose(abbrev_cidr):
         return "%s.0.0.0/%s" % (i, classful_prefix(i))
     except ValueError:
         #   Multi octet partial string address with optional prefix.
-        if '/' in abbrev_cidr:
-            part_addr, prefix = abbrev_cidr.split('/', 1)
-
+        part_addr, sep, prefix = abbrev_cidr.partition('/')
+        if sep:
             #   Check prefix for validity.
             try:
                 if not 0 <= int(prefix) <= 32:
@@ -1551,7 +1595,6 @@ def cidr_abbrev_to_verbose(abbrev_cidr):
             except ValueError:
                 return abbrev_cidr
         else:
-            part_addr = abbrev_cidr
             prefix = None
 
         tokens = part_addr.split('.')
@@ -1586,43 +1629,69 @@ def cidr_merge(ip_addrs):
     :return: a summarized list of `IPNetwork` objects.
     """
     # The algorithm is quite simple: For each CIDR we create an IP range.
-    # Sort them and merge when possible.  Afterwars split them again
-    # optimally.
+    # Sort them and merge when possible in a single pass.  Afterwards split
+    # them again optimally.
     if not hasattr(ip_addrs, '__iter__'):
         raise ValueError('A sequence or iterator is expected!')
 
+    merged = []
+
+    for version, first, last, original in _iter_merged(ip_addrs):
+        # If this range wasn't merged we can simply use the old cidr.
+        if original is None:
+            merged.extend(_iter_cidrs(first, last,
+                _VERSION_TO_MODULE[version]))
+        elif isinstance(original, IPRange):
+            merged.extend(original.cidrs())
+        elif isinstance(original, IPAddress):
+            merged.append(IPNetwork(original))
+        else:
+            merged.append(original)
+
+    return merged
+
+
+def _iter_merged(ip_addrs):
+    """
+    The sweep behind `cidr_merge`, yielding the union of the ip_addrs as
+    sorted (version, first, last, original) tuples of disjoint and
+    non-adjacent ranges. original is the single input a range came from, or
+    ``None`` if several inputs were merged into it.
+    """
     ranges = []
 
     for ip in ip_addrs:
-        if isinstance(ip, (IPNetwork, IPRange)):
-            net = ip
-        else:
-            net = IPNetwork(ip)
         # Since non-overlapping ranges are the common case, remember the original
-        ranges.append( (net.version, net.last, net.first, net) )
-
-    ranges.sort()
-    i = len(ranges) - 1
-    while i > 0:
-        if ranges[i][0] == ranges[i - 1][0] and ranges[i][2] - 1 <= ranges[i - 1][1]:
-            ranges[i - 1] = (ranges[i][0], ranges[i][1], min(ranges[i - 1][2], ranges[i][2]))
-            del ranges[i]
-        i -= 1
-    merged = []
-    for range_tuple in ranges:
-        # If this range wasn't merged we can simply use the old cidr.
-        if len(range_tuple) == 4:
-            original = range_tuple[3]
-            if isinstance(original, IPRange):
-                merged.extend(original.cidrs())
-            else:
-                merged.append(original)
+        if isinstance(ip, IPNetwork):
+            hostmask = ip._module.prefix_to_hostmask[ip._prefixlen]
+            first = ip._value & ~hostmask
+            ranges.append( (ip._module.version, first, first | hostmask, ip) )
+        elif isinstance(ip, IPAddress):
+            #   Only wrapped in an IPNetwork if it is not merged away.
+            ranges.append( (ip._module.version, ip._value, ip._value, ip) )
         else:
-            version = range_tuple[0]
-            range_start = IPAddress(range_tuple[2], version=version)
-            range_stop = IPAddress(range_tuple[1], version=version)
-            merged.extend(iprange_to_cidrs(range_start, range_stop))
-    return merged
+            if not isinstance(ip, IPRange):
+                ip = IPNetwork(ip)
+            ranges.append( (ip._module.version, ip.first, ip.last, ip) )
+
+    if not ranges:
+        return
+
+    ranges.sort(key=_itemgetter(0, 1, 2))
+
+    ranges_iter = iter(ranges)
+    cur_version, cur_first, cur_last, cur_original = _iter_next(ranges_iter)
+    for version, first, last, original in ranges_iter:
+        if version == cur_version and first - 1 <= cur_last:
+            #   Overlapping or adjacent, extend the current range.
+            if last > cur_last:
+                cur_last = last
+            cur_original = None
+        else:
+            yield cur_version, cur_first, cur_last, cur_original
+            cur_version, cur_first, cur_last, cur_original = \
+                version, first, last, original
+    yield cur_version, cur_first, cur_last, cur_original
 
 
 def cidr_exclude(target, exclude):
@@ -1671,32 +1740,24 @@ def cidr_partition(target, exclude):
     left = []
     right = []
 
-    new_prefixlen = target.prefixlen + 1
-    # Some @properties that are expensive to get and don't change below.
-    target_module_width = target._module.width
-
-    target_first = target.first
-    version = exclude.version
-    i_lower = target_first
-    i_upper = target_first + (2 ** (target_module_width - new_prefixlen))
-
-    while exclude.prefixlen >= new_prefixlen:
-        if exclude.first >= i_upper:
-            left.append(IPNetwork((i_lower, new_prefixlen), version=version))
-            matched = i_upper
+    module = target._module
+    width = module.width
+    netmasks = module.prefix_to_netmask
+    exclude_first = exclude.first
+    from_int = IPNetwork._from_int
+
+    #   For each prefix down to the exclude's, the exclude lies in one half
+    #   of the enclosing block, leaving the other half of it whole.
+    for prefixlen in _iter_range(target._prefixlen + 1, exclude._prefixlen + 1):
+        half = 1 << (width - prefixlen)
+        sibling = (exclude_first & netmasks[prefixlen]) ^ half
+        if exclude_first & half:
+            left.append(from_int(sibling, prefixlen, module))
         else:
-            right.append(IPNetwork((i_upper, new_prefixlen), version=version))
-            matched = i_lower
-
-        new_prefixlen += 1
-
-        if new_prefixlen > target_module_width:
-            break
+            right.append(from_int(sibling, prefixlen, module))
 
-        i_lower = matched
-        i_upper = matched + (2 ** (target_module_width - new_prefixlen))
-
-    return left, [exclude], right[::-1]
+    right.reverse()
+    return left, [exclude], right
 
 
 def spanning_cidr(ip_addrs):
@@ -1716,36 +1777,33 @@ def spanning_cidr(ip_addrs):
     except StopIteration:
         raise ValueError('IP sequence must contain at least 2 elements!')
 
-    if network_a < network_b:
-        min_network = network_a
-        max_network = network_b
-    else:
-        min_network = network_b
-        max_network = network_a
+    module = network_a._module
+    if network_b._module is not module:
+        raise TypeError('IP sequence cannot contain both IPv4 and IPv6!')
+
+    lowest_ipnum = min(network_a.first, network_b.first)
+    highest_ipnum = max(network_a.last, network_b.last)
 
     for ip in ip_addrs_iter:
         network = IPNetwork(ip)
-        if network < min_network:
-            min_network = network
-        if network > max_network:
-            max_network = network
-
-    if min_network.version != max_network.version:
-        raise TypeError('IP sequence cannot contain both IPv4 and IPv6!')
-
-    ipnum = max_network.last
-    prefixlen = max_network.prefixlen
-    lowest_ipnum = min_network.first
-    width = max_network._module.width
+        if network._module is not module:
+            raise TypeError('IP sequence cannot contain both IPv4 and IPv6!')
+        first = network.first
+        last = network.last
+        if first < lowest_ipnum:
+            lowest_ipnum = first
+        if last > highest_ipnum:
+            highest_ipnum = last
 
-    while prefixlen > 0 and ipnum > lowest_ipnum:
-        prefixlen -= 1
-        ipnum &= -(1<<(width-prefixlen))
+    #   The spanning prefix is the run of leading bits the lowest and highest
+    #   addresses have in common.
+    prefixlen = module.width - num_bits(lowest_ipnum ^ highest_ipnum)
+    ipnum = lowest_ipnum & module.prefix_to_netmask[prefixlen]
 
-    return IPNetwork( (ipnum, prefixlen), version=min_network.version )
+    return IPNetwork._from_int(ipnum, prefixlen, module)
 
 
-def iter_iprange(start, end, step=1):
+def iter_iprange(start, end, step=1, raw=False):
     """
     A generator that produces IPAddress objects between an arbitrary start
     and stop IP address with intervals of step between them. Sequences
@@ -1757,40 +1815,55 @@ def iter_iprange(start, end, step=1):
 
     :param step: (optional) size of step between IP addresses. Default: 1
 
-    :return: an iterator of one or more `IPAddress` objects.
+    :param raw: (optional) if ``True`` the integer values of the addresses
+        are produced instead of `IPAddress` objects. Default: False
+
+    :return: an iterator of one or more `IPAddress` objects (or integers).
     """
     start = IPAddress(start)
     end = IPAddress(end)
 
     if start.version != end.version:
         raise TypeError('start and stop IP versions do not match!')
-    version = start.version
 
     step = int(step)
     if step == 0:
         raise ValueError('step argument cannot be zero')
 
     #   We don't need objects from here, just integers.
-    start = int(start)
-    stop = int(end)
+    if raw:
+        it = _iter_ints(int(start), int(end), step)
+    else:
+        it = _iter_iprange(int(start), int(end), step, start._module)
+    for ip in it:
+        yield ip
 
-    negative_step = False
 
+def _iter_ints(start, stop, step):
+    """
+    The integer generator behind `iter_iprange`, for callers that already
+    hold validated integer boundaries. Sequences produced are inclusive of
+    the boundary values.
+    """
+    index = start
     if step < 0:
-        negative_step = True
-
-    index = start - step
-    while True:
-        index += step
-        if negative_step:
-            if not index >= stop:
-                break
-        else:
-            if not index <= stop:
-                break
-        yield IPAddress(index, version)
+        while index >= stop:
+            yield index
+            index += step
+    else:
+        while index <= stop:
+            yield index
+            index += step
 
 
+def _iter_iprange(start, stop, step, module):
+    """
+    As `_iter_ints` but wraps each integer in an `IPAddress` of module.
+    """
+    from_int = IPAddress._from_int
+    for index in _iter_ints(start, stop, step):
+        yield from_int(index, module)
+
 
 def iprange_to_cidrs(start, end):
     """
@@ -1804,28 +1877,34 @@ def iprange_to_cidrs(start, end):
 
     :return: a list of one or more IP addresses and subnets.
     """
-    cidr_list = []
-
     start = IPNetwork(start)
     end = IPNetwork(end)
 
-    iprange = [start.first, end.last]
+    module = start._module
+    if end._module is not module:
+        raise TypeError('IP sequence cannot contain both IPv4 and IPv6!')
 
-    #   Get spanning CIDR covering both addresses.
-    cidr_span = spanning_cidr([start, end])
-    width = start._module.width
+    return list(_iter_cidrs(start.first, end.last, module))
 
-    if cidr_span.first < iprange[0]:
-        exclude = IPNetwork((iprange[0]-1, width), version=start.version)
-        cidr_list = cidr_partition(cidr_span, exclude)[2]
-        cidr_span = cidr_list.pop()
-    if cidr_span.last > iprange[1]:
-        exclude = IPNetwork((iprange[1]+1, width), version=start.version)
-        cidr_list += cidr_partition(cidr_span, exclude)[0]
-    else:
-        cidr_list.append(cidr_span)
 
-    return cidr_list
+def _iter_cidrs(first, last, module):
+    """
+    A generator of the CIDRs `iprange_to_cidrs` returns, for callers that
+    already hold the boundaries of the range as integers of module.
+    """
+    width = module.width
+    from_int = IPNetwork._from_int
+
+    while first <= last:
+        #   The largest block that first is aligned to and that still fits
+        #   within the remainder of the range.
+        if first:
+            bits = min(num_bits(first & -first),
+                num_bits(last - first + 1)) - 1
+        else:
+            bits = num_bits(last + 1) - 1
+        yield from_int(first, width - bits, module)
+        first += 1 << bits
 
 
 def smallest_matching_cidr(ip, cidrs):
@@ -1835,7 +1914,8 @@ def smallest_matching_cidr(ip, cidrs):
 
     :param ip: a single IP address or subnet.
 
-    :param cidrs: a sequence of IP addresses and/or subnets.
+    :param cidrs: a sequence of IP addresses and/or subnets. See `IPTrie`
+        for repeated matching against the same sequence.
 
     :return: the smallest (most specific) matching IPAddress or IPNetwork
         object from the provided sequence, None if there was no match.
@@ -1847,12 +1927,13 @@ def smallest_matching_cidr(ip, cidrs):
             % (cidrs,))
 
     ip = IPAddress(ip)
-    for cidr in sorted([IPNetwork(cidr) for cidr in cidrs]):
+    #   Of the matches, the last in sorted order is the most specific.
+    for cidr in cidrs:
+        cidr = IPNetwork(cidr)
         if ip in cidr:
-            match = cidr
-        else:
-            if match is not None and cidr.network not in match:
-                break
+            key = cidr.sort_key()
+            if match is None or key >= match_key:
+                match, match_key = cidr, key
 
     return match
 
@@ -1864,7 +1945,8 @@ def largest_matching_cidr(ip, cidrs):
 
     :param ip: a single IP address or subnet.
 
-    :param cidrs: a sequence of IP addresses and/or subnets.
+    :param cidrs: a sequence of IP addresses and/or subnets. See `IPTrie`
+        for repeated matching against the same sequence.
 
     :return: the largest (least specific) matching IPAddress or IPNetwork
         object from the provided sequence, None if there was no match.
@@ -1876,10 +1958,13 @@ def largest_matching_cidr(ip, cidrs):
             % (cidrs,))
 
     ip = IPAddress(ip)
-    for cidr in sorted([IPNetwork(cidr) for cidr in cidrs]):
+    #   Of the matches, the first in sorted order is the least specific.
+    for cidr in cidrs:
+        cidr = IPNetwork(cidr)
         if ip in cidr:
-            match = cidr
-            break
+            key = cidr.sort_key()
+            if match is None or key < match_key:
+                match, match_key = cidr, key
 
     return match
 
@@ -1891,7 +1976,8 @@ def all_matching_cidrs(ip, cidrs):
 
     :param ip: a single IP address.
 
-    :param cidrs: a sequence of IP addresses and/or subnets.
+    :param cidrs: a sequence of IP addresses and/or subnets. See `IPTrie`
+        for repeated matching against the same sequence.
 
     :return: all matching IPAddress and/or IPNetwork objects from the provided
         sequence, an empty list if there was no match.
@@ -1903,15 +1989,61 @@ def all_matching_cidrs(ip, cidrs):
             % (cidrs,))
 
     ip = IPAddress(ip)
-    for cidr in sorted([IPNetwork(cidr) for cidr in cidrs]):
+    for cidr in cidrs:
+        cidr = IPNetwork(cidr)
         if ip in cidr:
             matches.append(cidr)
-        else:
-            if matches and cidr.network not in matches[-1]:
-                break
 
+    #   Only the (few) matches need sorting, not the whole sequence.
+    matches.sort(key=IPNetwork.sort_key)
     return matches
 
+
+def all_matching_cidrs_batch(ips, cidrs):
+    """
+    Matches each IP address in a sequence against a given sequence of IP
+    addresses and subnets.
+
+    The subnets are loaded into an `IPTrie` once, so this is much faster
+    than calling `all_matching_cidrs` for each IP address in turn.
+
+    :param ips: a sequence of IP addresses.
+
+    :param cidrs: a sequence of IP addresses and/or subnets.
+
+    :return: a list holding, for each IP address in ips, the list
+        `all_matching_cidrs` returns for it.
+    """
+    from netaddr.ip.trie import IPTrie
+
+    if not hasattr(cidrs, '__iter__'):
+        raise TypeError('IP address/subnet sequence expected, not %r!'
+            % (cidrs,))
+
+    #   The trie keeps one entry per subnet, so subnets equal once host bits
+    #   are ignored share a list, kept in sorted order.
+    trie = IPTrie()
+    groups = {}
+    for cidr in cidrs:
+        cidr = IPNetwork(cidr)
+        key = (cidr._module.version, cidr.first, cidr._prefixlen)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = []
+            trie.insert(cidr, group)
+        group.append(cidr)
+    for group in groups.values():
+        group.sort(key=IPNetwork.sort_key)
+
+    results = []
+    for ip in ips:
+        matches = []
+        for node in trie._iter_matches(IPAddress(ip)):
+            matches.extend([IPNetwork(cidr) for cidr in node.data])
+        results.append(matches)
+
+    return results
+
 #-----------------------------------------------------------------------------
 #   Cached IPv4 address range lookups.
 #-----------------------------------------------------------------------------
@@ -1970,3 +2102,78 @@ IPV6_RESERVED = (
     IPNetwork('E000::/4'), IPNetwork('F000::/5'),
     IPNetwork('F800::/6'), IPNetwork('FE00::/9'),
 )
+
+#-----------------------------------------------------------------------------
+#   Per-version dispatch tables for the BaseIP.is_*() predicates.
+#-----------------------------------------------------------------------------
+_MULTICAST = {
+    _ipv4: (IPV4_MULTICAST.first, IPV4_MULTICAST.last),
+    _ipv6: (IPV6_MULTICAST.first, IPV6_MULTICAST.last),
+}
+
+_LOOPBACK = {
+    _ipv4: (IPV4_LOOPBACK.first, IPV4_LOOPBACK.last),
+    _ipv6: (IPV6_LOOPBACK.first, IPV6_LOOPBACK.last),
+}
+
+_LINK_LOCAL = {
+    _ipv4: (IPV4_LINK_LOCAL.first, IPV4_LINK_LOCAL.last),
+    _ipv6: (IPV6_LINK_LOCAL.first, IPV6_LINK_LOCAL.last),
+}
+
+
+def _in_bounds(bounds, ip):
+    """
+    :param bounds: a tuple of the first and the last integer value of a
+        range.
+
+    :param ip: an `IPAddress` or `IPNetwork` object.
+
+    :return: ``True`` if ip falls entirely within bounds, ``False``
+        otherwise.
+    """
+    first, last = bounds
+    if isinstance(ip, IPAddress):
+        return first <= ip._value <= last
+    return first <= ip.first and ip.last <= last
+
+
+def _range_table(ranges):
+    """
+    :param ranges: a sequence of disjoint `IPNetwork` and `IPRange` objects.
+
+    :return: a tuple of two parallel lists, the first and the last integer
+        value of each range, sorted so they can be searched with bisect.
+    """
+    bounds = sorted([(r.first, r.last) for r in ranges])
+    return [first for first, _ in bounds], [last for _, last in bounds]
+
+
+_PRIVATE_RANGES = {
+    _ipv4: _range_table(IPV4_PRIVATE),
+    _ipv6: _range_table(IPV6_PRIVATE),
+}
+
+_RESERVED_RANGES = {
+    _ipv4: _range_table(IPV4_RESERVED),
+    _ipv6: _range_table(IPV6_RESERVED),
+}
+
+
+def _in_ranges(ranges, ip):
+    """
+    :param ranges: a table of disjoint ranges built by `_range_table`.
+
+    :param ip: an `IPAddress`, `IPNetwork` or `IPRange` object.
+
+    :return: ``True`` if ip falls entirely within one of the ranges,
+        ``False`` otherwise.
+    """
+    if isinstance(ip, IPAddress):
+        first = last = ip._value
+    else:
+        first, last = ip.first, ip.last
+    firsts, lasts = ranges
+    #   Find the last range starting at or below first.
+    i = _bisect.bisect_right(firsts, first) - 1
+    return i >= 0 and last <= lasts[i]
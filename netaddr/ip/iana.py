@@ -405,12 +405,12 @@ def pprint_info(fh=None):
 
 def _within_bounds(ip, ip_range):
     #   Boundary checking for multiple IP classes.
-    if hasattr(ip_range, 'first'):
-        #   IP network or IP range.
-        return ip in ip_range
-    elif hasattr(ip_range, 'value'):
+    if isinstance(ip_range, IPAddress):
         #   IP address.
         return ip == ip_range
+    elif isinstance(ip_range, (IPNetwork, IPRange)):
+        #   IP network or IP range.
+        return ip in ip_range
 
     raise Exception('Unsupported IP range or address: %r!' % (ip_range,))
 
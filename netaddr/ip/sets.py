@@ -105,8 +105,7 @@ class IPSet(object):
         if isinstance(iterable, IPNetwork):
             self._cidrs = {iterable.cidr: True}
         elif isinstance(iterable, IPRange):
-            self._cidrs = dict.fromkeys(
-                iprange_to_cidrs(iterable[0], iterable[-1]), True)
+            self._cidrs = dict.fromkeys(iterable.cidrs(), True)
         elif isinstance(iterable, IPSet):
             self._cidrs = dict.fromkeys(iterable.iter_cidrs(), True)
         else:
@@ -187,13 +186,12 @@ class IPSet(object):
         # cannot be merged. With only 1 candidate, we might as well make a
         # dictionary lookup.
         shift_width = added_network._module.width - added_network.prefixlen
+        version = added_network._module.version
         while added_network.prefixlen != 0:
-            # figure out if the least significant bit of the network part is 0 or 1.
-            the_bit = (added_network._value >> shift_width) & 1
-            if the_bit:
-                candidate = added_network.previous()
-            else:
-                candidate = added_network.next()
+            # The candidate differs from added_network only in the least
+            # significant bit of the network part, so flip that bit.
+            candidate = IPNetwork((added_network._value ^ (1 << shift_width),
+                added_network._prefixlen), version=version)
 
             if candidate not in self._cidrs:
                 # The only possible merge does not work -> merge done
@@ -279,8 +277,7 @@ class IPSet(object):
 
         """
         if isinstance(addr, IPRange):
-            new_cidrs = dict.fromkeys(
-                iprange_to_cidrs(addr[0], addr[-1]), True)
+            new_cidrs = dict.fromkeys(addr.cidrs(), True)
             self._cidrs.update(new_cidrs)
             self.compact()
             return
@@ -315,8 +312,7 @@ class IPSet(object):
 
         """
         if isinstance(addr, IPRange):
-            cidrs = iprange_to_cidrs(addr[0], addr[-1])
-            for cidr in cidrs:
+            for cidr in addr.cidrs():
                 self.remove(cidr)
             return
 
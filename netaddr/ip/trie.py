@@ -0,0 +1,246 @@
+#-----------------------------------------------------------------------------
+#   Copyright (c) 2008 by David P. D. Moss. All rights reserved.
+#
+#   Released under the BSD license. See the LICENSE file for details.
+#-----------------------------------------------------------------------------
+"""
+A longest prefix match lookup structure for IP subnets.
+"""
+from netaddr.core import num_bits
+from netaddr.ip import IPAddress, IPNetwork
+
+#: The number of leading address bits selecting a bucket of the filter.
+_BUCKET_BITS = 16
+
+
+class _Node(object):
+    """
+    A node of an `IPTrie`, covering every address that shares the first
+    prefixlen bits of value. Nodes created only to join two branches hold
+    no network.
+
+    The netmask of the prefix and the shift selecting the bit that follows
+    it are kept on the node, so lookups need no arithmetic on the prefix.
+    """
+    __slots__ = ('value', 'prefixlen', 'netmask', 'shift', 'children',
+        'network', 'data')
+
+    def __init__(self, module, value, prefixlen, network=None, data=None):
+        self.value = value
+        self.prefixlen = prefixlen
+        self.netmask = module.prefix_to_netmask[prefixlen]
+        self.shift = module.width - prefixlen - 1
+        self.children = [None, None]
+        self.network = network
+        self.data = data
+
+
+class IPTrie(object):
+    """
+    A set of IP subnets, each with an optional associated value, stored in a
+    path compressed binary (Patricia) trie.
+
+    Once built, finding the subnets that contain an IP address costs at most
+    one step per bit of the address no matter how many subnets are stored,
+    which makes an `IPTrie` the structure of choice for repeatedly matching
+    addresses against the same set of subnets (routing tables, ACLs, ...).
+    IPv4 and IPv6 subnets are held in separate tries, keyed on the IP
+    version.
+
+    Each trie is fronted by a table with one entry per possible value of
+    the leading 16 bits of an address, flagging those values covered by
+    some subnet. Addresses matching no subnet are mostly rejected there,
+    without walking the trie.
+
+    """
+    __slots__ = ('_roots', '_buckets', '_size')
+
+    def __init__(self, iterable=None):
+        """
+        Constructor.
+
+        :param iterable: (optional) an iterable containing IP addresses and
+            subnets.
+        """
+        self._roots = {}
+        self._buckets = {}
+        self._size = 0
+
+        if iterable is not None:
+            for network in iterable:
+                self.insert(network)
+
+    def insert(self, network, data=None):
+        """
+        Adds a subnet to this trie, replacing any subnet (and its value)
+        equal to it once host bits are ignored.
+
+        :param network: an IP address or subnet.
+
+        :param data: (optional) the value to associate with the subnet.
+            Default: the subnet itself.
+        """
+        network = IPNetwork(network)
+
+        module = network._module
+        width = module.width
+        netmasks = module.prefix_to_netmask
+        prefixlen = network._prefixlen
+        value = network._value & netmasks[prefixlen]
+
+        version = module.version
+        node = self._roots.get(version)
+        if node is None:
+            node = self._roots[version] = _Node(module, 0, 0)
+            self._buckets[version] = bytearray(1 << _BUCKET_BITS)
+
+        shift = width - _BUCKET_BITS
+        lo = value >> shift
+        hi = (value | module.prefix_to_hostmask[prefixlen]) >> shift
+        self._buckets[version][lo:hi + 1] = b'\x01' * (hi - lo + 1)
+
+        while True:
+            if node.prefixlen == prefixlen:
+                if node.network is None:
+                    self._size += 1
+                node.network = network
+                node.data = data
+                return
+
+            bit = (value >> node.shift) & 1
+            child = node.children[bit]
+            if child is None:
+                self._size += 1
+                node.children[bit] = _Node(module, value, prefixlen, network,
+                    data)
+                return
+
+            #   The number of leading bits the child and the new subnet share.
+            common = min(width - num_bits(child.value ^ value),
+                child.prefixlen, prefixlen)
+            if common == child.prefixlen:
+                node = child
+                continue
+
+            #   Split the edge to the child at the point the two diverge.
+            fork = _Node(module, value & netmasks[common], common)
+            node.children[bit] = fork
+            fork.children[(child.value >> fork.shift) & 1] = child
+            self._size += 1
+            if common == prefixlen:
+                fork.network = network
+                fork.data = data
+            else:
+                fork.children[(value >> fork.shift) & 1] = \
+                    _Node(module, value, prefixlen, network, data)
+            return
+
+    def _iter_matches(self, ip):
+        """
+        A generator of the nodes holding subnets that contain ip, least
+        specific first.
+        """
+        if not isinstance(ip, IPAddress):
+            ip = IPAddress(ip)
+
+        module = ip._module
+        version = module.version
+        node = self._roots.get(version)
+        if node is None:
+            return
+
+        value = ip._value
+        if not self._buckets[version][value >> (module.width - _BUCKET_BITS)]:
+            return
+
+        while node is not None:
+            if value & node.netmask != node.value:
+                break
+            if node.network is not None:
+                yield node
+            if node.shift < 0:
+                break
+            node = node.children[(value >> node.shift) & 1]
+
+    def find(self, ip):
+        """
+        :param ip: an IP address.
+
+        :return: the value associated with the most specific (longest
+            prefix) subnet containing ip, ``None`` if there is no match.
+        """
+        match = None
+        for node in self._iter_matches(ip):
+            match = node
+        if match is None:
+            return None
+        if match.data is None:
+            return IPNetwork(match.network)
+        return match.data
+
+    def containing_networks(self, ip):
+        """
+        :param ip: an IP address.
+
+        :return: a list of all subnets containing ip, least specific first.
+            An empty list if there is no match.
+        """
+        return [IPNetwork(node.network) for node in self._iter_matches(ip)]
+
+    def __contains__(self, ip):
+        """
+        :param ip: an IP address.
+
+        :return: ``True`` if ip falls within any subnet in this trie,
+            ``False`` otherwise.
+        """
+        for node in self._iter_matches(ip):
+            return True
+        return False
+
+    def _iter_nodes(self):
+        """
+        A generator of the nodes holding subnets, in sorted order of their
+        subnets.
+        """
+        for version in sorted(self._roots):
+            stack = [self._roots[version]]
+            while stack:
+                node = stack.pop()
+                if node.network is not None:
+                    yield node
+                for child in reversed(node.children):
+                    if child is not None:
+                        stack.append(child)
+
+    def __iter__(self):
+        """
+        :return: an iterator over the subnets in this trie, in sorted order.
+        """
+        for node in self._iter_nodes():
+            yield IPNetwork(node.network)
+
+    def __getstate__(self):
+        """:return: Pickled state of an `IPTrie` object."""
+        return tuple([(node.network.__getstate__(), node.data)
+            for node in self._iter_nodes()])
+
+    def __setstate__(self, state):
+        """
+        :param state: data used to unpickle a pickled `IPTrie` object.
+
+        """
+        self._roots = {}
+        self._buckets = {}
+        self._size = 0
+
+        for (value, prefixlen, version), data in state:
+            self.insert(IPNetwork((value, prefixlen), version=version), data)
+
+    def __len__(self):
+        """:return: the number of subnets in this trie."""
+        return self._size
+
+    def __repr__(self):
+        """:return: Python statement to create an equivalent object"""
+        return 'IPTrie(%r)' % [str(network) for network in self]
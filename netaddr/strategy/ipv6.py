@@ -194,8 +194,11 @@ def int_to_packed(int_val):
     :return: a packed string that is equivalent to value represented by an
     unsigned integer.
     """
-    words = int_to_words(int_val, 4, 32)
-    return _struct.pack('>4I', *words)
+    if not 0 <= int_val <= max_int:
+        raise IndexError('integer out of bounds: %r!' % hex(int_val))
+
+    #   Two 64-bit halves need fewer big integer operations than 32-bit words.
+    return _struct.pack('>2Q', int_val >> 64, int_val & 0xffffffffffffffff)
 
 
 def packed_to_int(packed_int):
@@ -206,15 +209,8 @@ def packed_to_int(packed_int):
     :return: An unsigned integer equivalent to value of network address
         represented by packed binary string.
     """
-    words = list(_struct.unpack('>4I', packed_int))
-
-    int_val = 0
-    for i, num in enumerate(reversed(words)):
-        word = num
-        word = word << 32 * i
-        int_val = int_val | word
-
-    return int_val
+    high, low = _struct.unpack('>2Q', packed_int)
+    return high << 64 | low
 
 
 def valid_words(words):
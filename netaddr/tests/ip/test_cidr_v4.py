@@ -1,5 +1,7 @@
 import random
 
+import pytest
+
 from netaddr import iprange_to_cidrs, IPNetwork, cidr_merge, cidr_exclude, largest_matching_cidr, smallest_matching_cidr, \
     all_matching_cidrs
 
@@ -72,6 +74,22 @@ def test_iprange_to_cidrs_worst_case_v4():
     ]
 
 
+def test_iprange_to_cidrs_end_subnet_covering_start_v4():
+    networks = iprange_to_cidrs('10.0.4.6/31', '10.0.0.0/14')
+    assert networks[0] == IPNetwork('10.0.4.6/31')
+    assert networks[-1] == IPNetwork('10.2.0.0/15')
+    assert networks[-1].last == IPNetwork('10.0.0.0/14').last
+
+
+def test_iprange_to_cidrs_full_and_empty_ranges_v4():
+    assert iprange_to_cidrs('0.0.0.0', '255.255.255.255') == [IPNetwork('0.0.0.0/0')]
+    assert iprange_to_cidrs('192.0.2.7', '192.0.2.7') == [IPNetwork('192.0.2.7/32')]
+    assert iprange_to_cidrs('192.0.2.7', '192.0.2.6') == []
+
+    with pytest.raises(TypeError):
+        iprange_to_cidrs('192.0.2.0', '::1')
+
+
 def test_cidr_exclude_v4():
     assert cidr_exclude('192.0.2.1/32', '192.0.2.1/32') == []
     assert cidr_exclude('192.0.2.0/31', '192.0.2.1/32') == [IPNetwork('192.0.2.0/32')]
@@ -157,6 +175,15 @@ def test_smallest_matching_cidr_v4():
     assert smallest_matching_cidr('192.0.2.0', ['10.0.0.1', '224.0.0.1']) is None
 
 
+def test_matching_cidr_unsorted_input_v4():
+    networks = ['192.0.2.7/24', '10.0.0.0/8', '192.0.0.0/16', '192.0.2.3/24',
+        '192.0.3.0/24', '192.0.9.9/16']
+
+    assert str(largest_matching_cidr('192.0.2.1', networks)) == '192.0.0.0/16'
+    assert str(smallest_matching_cidr('192.0.2.1', networks)) == '192.0.2.7/24'
+    assert smallest_matching_cidr('192.0.4.1', networks) == IPNetwork('192.0.0.0/16')
+
+
 def test_all_matching_cidrs_v4():
     assert all_matching_cidrs('192.0.2.32', ['0.0.0.0/0', '10.0.0.0/8', '192.0.0.0/8', '192.0.1.0/24', '192.0.2.0/24', '192.0.3.0/24']) == [
         IPNetwork('0.0.0.0/0'),
@@ -1,3 +1,4 @@
+import copy
 import weakref
 
 from netaddr import IPAddress, IPNetwork, IPRange
@@ -6,3 +7,17 @@ def test_ip_classes_are_weak_referencable():
     weakref.ref(IPAddress('10.0.0.1'))
     weakref.ref(IPNetwork('10.0.0.1/8'))
     weakref.ref(IPRange('10.0.0.1', '10.0.0.10'))
+
+def test_ip_classes_have_no_instance_dict():
+    for obj in (IPAddress('10.0.0.1'), IPNetwork('10.0.0.1/8'),
+                IPRange('10.0.0.1', '10.0.0.10'), IPAddress('fe80::1'),
+                IPNetwork('fe80::/64')):
+        assert not hasattr(obj, '__dict__')
+
+def test_ip_classes_can_be_copied():
+    for obj in (IPAddress('10.0.0.1'), IPNetwork('10.0.0.1/8'),
+                IPRange('10.0.0.1', '10.0.0.10'), IPAddress('fe80::1'),
+                IPNetwork('fe80::1/64')):
+        assert copy.copy(obj) == obj
+        assert copy.deepcopy(obj) == obj
+        assert str(copy.copy(obj)) == str(obj)
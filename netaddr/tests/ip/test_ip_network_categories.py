@@ -16,11 +16,23 @@ def test_is_private():
     assert IPNetwork('fc00::/7').is_private()
 
 
+def test_is_private_network_ending_on_range_boundary():
+    assert IPNetwork('239.255.255.0/24').is_private()
+    assert IPNetwork('239.0.0.0/8').is_private()
+    assert not IPNetwork('238.0.0.0/7').is_private()
+
+
 def test_is_reserved():
     assert IPNetwork('240.0.0.0/24').is_reserved()
     assert IPNetwork('0::/48').is_reserved()
 
 
+def test_is_reserved_network_ending_on_range_boundary():
+    assert IPNetwork('238.255.255.0/24').is_reserved()
+    assert IPNetwork('231.255.255.0/24').is_reserved()
+    assert not IPNetwork('224.0.0.0/5').is_reserved()
+
+
 def test_is_loopback():
     assert IPNetwork('127.0.0.0/8').is_loopback()
     assert IPNetwork('::1/128').is_loopback()
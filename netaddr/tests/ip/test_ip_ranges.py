@@ -1,7 +1,7 @@
 import pickle
 import pytest
 
-from netaddr import iter_iprange, IPAddress, cidr_merge, IPNetwork, IPRange, ZEROFILL, AddrFormatError
+from netaddr import iter_iprange, iter_unique_ips, IPAddress, cidr_merge, IPNetwork, IPRange, ZEROFILL, AddrFormatError
 from netaddr.compat import _sys_maxint
 
 
@@ -106,6 +106,27 @@ def test_iprange_boundaries():
     ]
 
 
+def test_iprange_raw_integers():
+    assert list(iter_iprange('192.0.2.0', '192.0.2.7', 2, raw=True)) == [
+        3221225984, 3221225986, 3221225988, 3221225990]
+    assert list(iter_iprange('192.0.2.7', '192.0.2.0', -3, raw=True)) == [
+        3221225991, 3221225988, 3221225985]
+
+
+def test_iter_unique_ips():
+    assert list(iter_unique_ips(
+            '192.0.2.6/31', IPRange('192.0.2.3', '192.0.2.6'), '::1',
+            IPAddress('192.0.2.4'), IPNetwork('192.0.2.1/32'))) == [
+        IPAddress('192.0.2.1'),
+        IPAddress('192.0.2.3'),
+        IPAddress('192.0.2.4'),
+        IPAddress('192.0.2.5'),
+        IPAddress('192.0.2.6'),
+        IPAddress('192.0.2.7'),
+        IPAddress('::1'),
+    ]
+
+
 def test_iprange_boolean_evaluation():
     assert bool(IPRange('0.0.0.0', '255.255.255.255'))
     assert bool(IPRange('0.0.0.0', '0.0.0.0'))
@@ -188,6 +209,11 @@ def test_iprange_membership():
     assert IPRange('192.0.2.5', '192.0.2.10') in IPRange('192.0.2.1', '192.0.2.254')
     assert IPRange('fe80::1', 'fe80::fffe') in IPRange('fe80::', 'fe80::ffff:ffff:ffff:ffff')
     assert IPRange('192.0.2.5', '192.0.2.10') not in IPRange('::', '::255.255.255.255')
+    assert IPAddress('192.0.2.1') in IPRange('192.0.2.1', '192.0.2.254')
+    assert IPAddress('192.0.2.255') not in IPRange('192.0.2.1', '192.0.2.254')
+    assert IPAddress('::192.0.2.1') not in IPRange('192.0.2.1', '192.0.2.254')
+    assert IPNetwork('192.0.2.0/24') in IPRange('192.0.2.0', '192.0.2.255')
+    assert IPNetwork('192.0.2.0/24') not in IPRange('192.0.2.0', '192.0.2.254')
 
 
 def test_more_iprange_sorting():
@@ -0,0 +1,159 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from netaddr import (IPAddress, IPNetwork, IPTrie, AddrFormatError,
+    all_matching_cidrs, all_matching_cidrs_batch, smallest_matching_cidr)
+
+
+def test_iptrie_basic_api():
+    trie = IPTrie(['192.0.2.0/24', '192.0.2.128/25', '192.0.0.0/16', '::/0'])
+
+    assert len(trie) == 4
+    assert list(trie) == [
+        IPNetwork('192.0.0.0/16'),
+        IPNetwork('192.0.2.0/24'),
+        IPNetwork('192.0.2.128/25'),
+        IPNetwork('::/0'),
+    ]
+
+    assert trie.containing_networks('192.0.2.200') == [
+        IPNetwork('192.0.0.0/16'),
+        IPNetwork('192.0.2.0/24'),
+        IPNetwork('192.0.2.128/25'),
+    ]
+    assert trie.containing_networks('192.0.3.1') == [IPNetwork('192.0.0.0/16')]
+    assert trie.containing_networks('10.0.0.1') == []
+    assert trie.containing_networks('fe80::1') == [IPNetwork('::/0')]
+
+    assert trie.find('192.0.2.1') == IPNetwork('192.0.2.0/24')
+    assert trie.find('10.0.0.1') is None
+
+    assert IPAddress('192.0.2.1') in trie
+    assert '10.0.0.1' not in trie
+
+
+def test_iptrie_values():
+    trie = IPTrie()
+    trie.insert('10.0.0.0/8', 'corp')
+    trie.insert('10.1.0.0/16', 'lab')
+    trie.insert('10.1.0.0/24')
+
+    assert trie.find('10.2.3.4') == 'corp'
+    assert trie.find('10.1.3.4') == 'lab'
+    assert trie.find('10.1.0.4') == IPNetwork('10.1.0.0/24')
+
+    trie.insert('10.1.0.5/16', 'lab2')
+    assert len(trie) == 3
+    assert trie.find('10.1.3.4') == 'lab2'
+
+
+def test_iptrie_single_addresses_and_whole_space():
+    trie = IPTrie([IPAddress('192.0.2.1'), '0.0.0.0/0', '192.0.2.1/32'])
+
+    assert len(trie) == 2
+    assert trie.containing_networks('192.0.2.1') == [
+        IPNetwork('0.0.0.0/0'),
+        IPNetwork('192.0.2.1/32'),
+    ]
+    assert trie.find('192.0.2.2') == IPNetwork('0.0.0.0/0')
+
+
+def test_iptrie_filter_bucket_boundaries():
+    trie = IPTrie(['10.0.255.255/32', '2001:db8::/48'])
+
+    assert '10.0.255.255' in trie
+    assert '10.0.255.254' not in trie
+    assert '10.1.0.0' not in trie
+    assert '2001:db8:0:ffff::1' in trie
+    assert '2001:db9::' not in trie
+
+    trie.insert('0.0.0.0/0')
+    assert trie.find('10.1.0.0') == IPNetwork('0.0.0.0/0')
+    assert trie.find('255.255.255.255') == IPNetwork('0.0.0.0/0')
+
+
+def test_iptrie_results_are_copies():
+    trie = IPTrie(['192.0.2.0/24'])
+    network = trie.find('192.0.2.1')
+    network.prefixlen = 8
+    assert trie.find('192.0.2.1') == IPNetwork('192.0.2.0/24')
+
+
+def test_iptrie_pickling():
+    trie = IPTrie(['192.0.2.0/24', 'fe80::/64'])
+    trie.insert('192.0.2.5/25', 'lab')
+
+    trie2 = pickle.loads(pickle.dumps(trie))
+    assert trie2 is not trie
+    assert len(trie2) == 3
+    assert list(trie2) == list(trie)
+    assert str(trie2.containing_networks('192.0.2.1')[1]) == '192.0.2.5/25'
+    assert trie2.find('192.0.2.1') == 'lab'
+    assert trie2.find('fe80::1') == IPNetwork('fe80::/64')
+    assert '192.0.3.1' not in trie2
+
+
+def test_iptrie_copying():
+    trie = IPTrie(['192.0.2.0/24'])
+    trie.insert('10.0.0.0/8', ['corp'])
+
+    for trie2 in (copy.copy(trie), copy.deepcopy(trie)):
+        trie2.insert('192.0.2.0/25')
+        assert len(trie2) == 3
+        assert len(trie) == 2
+        assert list(trie) == [IPNetwork('10.0.0.0/8'), IPNetwork('192.0.2.0/24')]
+        assert trie2.find('10.1.1.1') == ['corp']
+
+    assert copy.copy(trie).find('10.1.1.1') is trie.find('10.1.1.1')
+    assert copy.deepcopy(trie).find('10.1.1.1') is not trie.find('10.1.1.1')
+
+
+def test_iptrie_bad_input():
+    with pytest.raises(AddrFormatError):
+        IPTrie(['foo'])
+
+    with pytest.raises(AddrFormatError):
+        IPTrie().find('foo')
+
+
+@pytest.mark.parametrize('version, width', [(4, 32), (6, 128)])
+def test_iptrie_matches_linear_scan(version, width):
+    rng = random.Random(version)
+    base = rng.getrandbits(width)
+    cidrs = []
+    for i in range(200):
+        prefixlen = rng.randint(0, width)
+        value = base ^ rng.randrange(1 << rng.randint(0, width))
+        cidrs.append(IPNetwork((value, prefixlen), version=version).cidr)
+
+    trie = IPTrie(cidrs)
+    cidrs = sorted(set(cidrs))
+    assert list(trie) == cidrs
+
+    for i in range(200):
+        ip = IPAddress(base ^ rng.randrange(1 << rng.randint(0, width)), version)
+        assert trie.containing_networks(ip) == all_matching_cidrs(ip, cidrs)
+        assert trie.find(ip) == smallest_matching_cidr(ip, cidrs)
+
+
+def test_all_matching_cidrs_batch():
+    cidrs = ['192.0.2.0/24', '192.0.2.32/27', '192.0.2.40/24', '::/0',
+        IPAddress('192.0.2.33')]
+    ips = ['192.0.2.33', '192.0.2.1', IPAddress('10.0.0.1'), '::1']
+
+    assert all_matching_cidrs_batch(ips, cidrs) == [
+        [IPNetwork('192.0.2.0/24'), IPNetwork('192.0.2.40/24'),
+            IPNetwork('192.0.2.32/27'), IPNetwork('192.0.2.33/32')],
+        [IPNetwork('192.0.2.0/24'), IPNetwork('192.0.2.40/24')],
+        [],
+        [IPNetwork('::/0')],
+    ]
+    assert all_matching_cidrs_batch(ips, cidrs) == [
+        all_matching_cidrs(ip, cidrs) for ip in ips]
+    assert all_matching_cidrs_batch([], cidrs) == []
+
+    with pytest.raises(TypeError):
+        all_matching_cidrs_batch(ips, None)
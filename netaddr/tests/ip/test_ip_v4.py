@@ -2,6 +2,7 @@ import pickle
 import types
 import random
 import sys
+import threading
 
 import pytest
 
@@ -219,6 +220,9 @@ def test_ipaddress_binary_operations_v4():
     assert IPAddress('192.0.2.15') & IPAddress('255.255.255.0') == IPAddress('192.0.2.0')
     assert IPAddress('255.255.0.0') | IPAddress('0.0.255.255') == IPAddress('255.255.255.255')
     assert IPAddress('255.255.0.0') ^ IPAddress('255.0.0.0') == IPAddress('0.255.0.0')
+    assert IPAddress('192.0.2.15') & 0xffffff00 == IPAddress('192.0.2.0')
+    assert IPAddress('192.0.2.0') | 0xff == IPAddress('192.0.2.255')
+    assert IPAddress('192.0.2.255') ^ 0xf0 == IPAddress('192.0.2.15')
     assert IPAddress('1.2.3.4').packed == '\x01\x02\x03\x04'.encode('ascii')
 
 
@@ -328,6 +332,15 @@ def test_ipaddress_integer_constructor_v4():
     assert IPAddress(10) == IPAddress('0.0.0.10')
 
 
+def test_ipaddress_integer_constructor_out_of_bounds():
+    with pytest.raises(AddrFormatError):
+        IPAddress(-1, 4)
+    with pytest.raises(AddrFormatError):
+        IPAddress(2 ** 32, 4)
+    with pytest.raises(AddrFormatError):
+        IPAddress(2 ** 128, 6)
+
+
 def test_ipaddress_integer_constructor_v6():
     assert IPAddress(0x1ffffffff) == IPAddress('::1:ffff:ffff')
     assert IPAddress(0xffffffff, 6) == IPAddress('::255.255.255.255')
@@ -347,6 +360,12 @@ def test_ipaddress_inet_aton_constructor_v4():
     assert IPAddress('127.1') == IPAddress('127.0.0.1')
     assert IPAddress('127.0.1') == IPAddress('127.0.0.1')
 
+    #   Explicit IP version.
+    assert IPAddress('127.0.0.1', 4) == IPAddress('127.0.0.1')
+
+    with pytest.raises(AddrFormatError):
+        IPAddress('127.0.0.1', 6)
+
 
 def test_ipaddress_inet_pton_constructor_v4():
     with pytest.raises(AddrFormatError):
@@ -401,6 +420,47 @@ def test_ipnetwork_constructor_other_flags_v4():
     assert IPNetwork('172.24.200', implicit_prefix=True, flags=NOHOST) == IPNetwork('172.24.0.0/16')
 
 
+def test_ipnetwork_repeated_string_constructor_v4():
+    net1 = IPNetwork('192.0.2.0/24')
+    net2 = IPNetwork('192.0.2.0/24')
+    assert net1 is not net2
+    net1.prefixlen = 16
+    net1 += 1
+    assert net1 == IPNetwork('192.1.2.0/16')
+    assert net2 == IPNetwork('192.0.2.0/24')
+    assert IPNetwork('192.0.2.0/24', flags=NOHOST) == IPNetwork('192.0.2.0/24')
+    assert IPNetwork('192.0.2.0/24', version=4) == IPNetwork('192.0.2.0/24')
+
+
+def test_ipnetwork_string_constructor_threads():
+    errors = []
+
+    def construct(n):
+        try:
+            for i in range(6000):
+                network = IPNetwork('%d.%d.%d.0/24' % (n, i >> 8, i & 255))
+                assert network.value == (n << 24) | (i << 8)
+        except Exception as e:
+            errors.append(e)
+
+    switch_interval = getattr(sys, 'getswitchinterval', None)
+    if switch_interval is not None:
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=construct, args=(n,))
+            for n in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if switch_interval is not None:
+            sys.setswitchinterval(old_interval)
+
+    assert errors == []
+
+
 def test_ipnetwork_bad_string_constructor():
     with pytest.raises(AddrFormatError):
         IPNetwork('foo')
@@ -539,6 +599,12 @@ def test_ipnetwork_change_netmask():
     ip.netmask = 'ffff:ffff:ffff:ffff::'
     assert ip.prefixlen == 64
 
+    with pytest.raises(ValueError):
+        ip.netmask = 'ffff:0:ffff::'
+    with pytest.raises(ValueError):
+        ip.netmask = '255.255.0.0'
+    assert ip.prefixlen == 64
+
 
 def test_spanning_cidr_handles_strings():
     # This that a regression introduced in 0fda41a is fixed. The regression caused an error when str
@@ -551,3 +617,11 @@ def test_spanning_cidr_handles_strings():
     ]
     assert spanning_cidr(addresses) == IPNetwork('10.0.0.0/29')
     assert spanning_cidr(reversed(addresses)) == IPNetwork('10.0.0.0/29')
+
+
+def test_spanning_cidr_is_smallest_covering_subnet():
+    assert spanning_cidr(['10.0.0.0/8', '10.0.0.0/8']) == IPNetwork('10.0.0.0/8')
+    assert spanning_cidr(['10.0.0.0/8', '10.1.0.0/16']) == IPNetwork('10.0.0.0/8')
+    assert spanning_cidr(['10.1.0.0/16', '10.0.0.0/8']) == IPNetwork('10.0.0.0/8')
+    assert spanning_cidr(['192.0.2.255', '192.0.3.0']) == IPNetwork('192.0.2.0/23')
+    assert spanning_cidr(['0.0.0.0', '255.255.255.255']) == IPNetwork('0.0.0.0/0')
@@ -1,5 +1,7 @@
 import types
 
+import pytest
+
 from netaddr import IPNetwork, cidr_merge
 
 def test_ipnetwork_cidr_merge():
@@ -63,6 +65,35 @@ def test_subnetting():
     ]
 
 
+def test_subnetting_count_and_bad_prefix():
+    ip = IPNetwork('172.24.0.5/23')
+    assert list(ip.subnet(25, count=2)) == [
+        IPNetwork('172.24.0.0/25'),
+        IPNetwork('172.24.0.128/25'),
+    ]
+    assert list(ip.subnet(22)) == []
+
+    with pytest.raises(ValueError):
+        list(ip.subnet(33))
+
+    with pytest.raises(ValueError):
+        list(ip.subnet(24, count=3))
+
+
+def test_next_and_previous():
+    ip = IPNetwork('192.0.2.5/24')
+    assert ip.next() == IPNetwork('192.0.3.0/24')
+    assert ip.next(2) == IPNetwork('192.0.4.0/24')
+    assert ip.previous() == IPNetwork('192.0.1.0/24')
+    assert ip == IPNetwork('192.0.2.5/24')
+
+    with pytest.raises(IndexError):
+        IPNetwork('255.255.255.0/24').next()
+
+    with pytest.raises(IndexError):
+        IPNetwork('0.0.0.0/24').previous()
+
+
 def test_supernetting():
     ip = IPNetwork('192.0.2.114')
     supernets = ip.supernet(22)
@@ -79,3 +110,11 @@ def test_supernetting():
         IPNetwork('192.0.2.112/30'),
         IPNetwork('192.0.2.114/31'),
     ]
+
+    assert IPNetwork('192.0.2.0/24').supernet(24) == []
+
+    with pytest.raises(ValueError):
+        IPNetwork('192.0.2.0/24').supernet(30)
+
+    with pytest.raises(ValueError):
+        IPNetwork('192.0.2.0/24').supernet(33)